@@ -6,16 +6,25 @@ import urllib.parse
 import os
 import sys
 import ctypes
+import functools
 import re
 import configparser
+from operator import itemgetter
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, date
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Dict, Iterator, List, Tuple, Optional, Sequence
 
 try:
     import openpyxl
 except ImportError as e:
     raise SystemExit("openpyxl が必要です: pip install openpyxl") from e
 
+try:
+    # 任意: config.ini の fast_reader = true で使う高速な Rust 実装
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None  # type: ignore[assignment,misc]
+
 
 # =====================
 # Windows AppUserModelID
@@ -53,20 +62,26 @@ def resource_path(relative_path: str) -> str:
 # Utilities
 # =====================
 def safe_str(v: Any) -> str:
+    # セル数だけ呼ばれるので、大半を占める str / None を先に判定する
     if v is None:
         return ""
-    if isinstance(v, (datetime, date)):
+    if type(v) is str:
+        return v
+    if isinstance(v, datetime):
         return v.isoformat(sep=" ")
+    if isinstance(v, date):
+        return v.isoformat()  # date.isoformat は sep を取らない
     return str(v)
 
 
+_WS_RE = re.compile(r"\s+")
+_QUERY_TRANS = str.maketrans({"\r": " ", "\n": " ", "　": " "})
+
+
 def normalize_query(s: str) -> str:
     if not s:
         return ""
-    s = s.replace("\r", " ").replace("\n", " ")
-    s = s.replace("　", " ")
-    s = re.sub(r"\s+", " ", s)
-    return s.strip()
+    return _WS_RE.sub(" ", s.translate(_QUERY_TRANS)).strip()
 
 
 def truncate(s: str, n: int = 80) -> str:
@@ -74,6 +89,105 @@ def truncate(s: str, n: int = 80) -> str:
     return s[:n] + ("…" if len(s) > n else "")
 
 
+# =====================
+# Workbook ingest
+# =====================
+# (headers, rows_all, rows_all を行ごとに連結・小文字化したフィルタ用文字列)
+SheetData = Tuple[List[str], List[Tuple[str, ...]], List[str]]
+
+# これより短いセル文字列は sys.intern する（区分値などの重複を1つにまとめる）
+_INTERN_MAX_LEN = 20
+
+
+def open_workbook(fp: str, fast_reader: bool = False) -> Tuple[Any, List[str]]:
+    """ブックを開いて (workbook, シート名一覧) を返す。
+    既定は openpyxl(read_only, 数式はそのまま表示)。
+    fast_reader=True かつ python-calamine があればそちらを使う（数式は計算結果の表示になる）。
+    """
+    if fast_reader and CalamineWorkbook is not None:
+        try:
+            wb = CalamineWorkbook.from_path(fp)
+            return wb, list(wb.sheet_names)
+        except Exception:
+            pass
+    wb = openpyxl.load_workbook(fp, read_only=True, data_only=False)
+    return wb, list(wb.sheetnames)
+
+
+# Excel の数値は有効15桁。これ未満の整数値だけ int に戻す
+_EXACT_INT_LIMIT = 1e15
+
+
+def _calamine_value(v: Any) -> Any:
+    """calamine の値を openpyxl と同じ型にそろえる（表示が読み込み方法で変わらないように）"""
+    t = type(v)
+    if t is float:
+        # calamine は数値を全部 float で返すので、整数値は int に戻す（1.0 -> 1）。
+        # 桁が大きい値は float のまま（openpyxl と同じく 1e+20 などと表示する）
+        return int(v) if v.is_integer() and abs(v) < _EXACT_INT_LIMIT else v
+    if t is date:
+        # openpyxl は日付セルを datetime で返す
+        return datetime(v.year, v.month, v.day)
+    return v
+
+
+def iter_sheet_rows(wb: Any, sheet_name: str) -> Iterator[Sequence[Any]]:
+    """シートの生の値を行ごとに返す（A1 起点。行・列番号は Excel と一致）"""
+    if CalamineWorkbook is not None and isinstance(wb, CalamineWorkbook):
+        # skip_empty_area=False: 先頭の空行/空列を詰めない（行番号・列記号を保つ）
+        for row in wb.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False):
+            yield [_calamine_value(v) for v in row]
+        return
+
+    ws = wb[sheet_name]
+    max_row = ws.max_row or 0
+    max_col = ws.max_column or 0
+    yield from ws.iter_rows(min_row=1, max_row=max_row, max_col=max_col, values_only=True)
+
+
+def parse_sheet(wb: Any, name: str) -> SheetData:
+    """シートを文字列化して SheetData を返す。UI スレッド外から呼ぶ想定"""
+    values: List[List[str]] = []
+    last_col = 0  # 空でないセルがある最も右の列（1 始まり）
+    for row in iter_sheet_rows(wb, name):
+        r = [safe_str(v) for v in row]
+        # 右から見て、既知の last_col より右に値があるかだけ調べる
+        for i in range(len(r) - 1, last_col - 1, -1):
+            if r[i] != "":
+                last_col = i + 1
+                break
+        values.append(r)
+
+    col_letters = [openpyxl.utils.get_column_letter(i) for i in range(1, last_col + 1)]
+    headers = ["#"] + col_letters
+
+    # 行は tuple（list より小さい）。短い文字列は同じ値が繰り返されやすいので intern して共有する
+    # trim trailing empty columns も同時に行う
+    intern = sys.intern
+    rows: List[Tuple[str, ...]] = [
+        (str(i), *[c if len(c) >= _INTERN_MAX_LEN else intern(c) for c in r[:last_col]])
+        for i, r in enumerate(values, start=1)
+    ]
+    rows_lc = ["\t".join(r).lower() for r in rows]
+    return headers, rows, rows_lc
+
+
+def close_workbook(wb: Any) -> None:
+    """read_only のブックはファイルハンドルを握ったままなので明示的に閉じる"""
+    try:
+        wb.close()
+    except Exception:
+        pass
+
+
+# apply_filter が一度に調べる行数（これを超えると after で分けて流し込む）
+_FILTER_CHUNK = 20000
+
+# Zebra tags（行ごとにタプルを作らない）
+_TAG_EVEN = ("even",)
+_TAG_ODD = ("odd",)
+
+
 DEFAULT_ENGINES: Dict[str, str] = {
     "Google": "https://www.google.com/search?q={query}",
     "Bing": "https://www.bing.com/search?q={query}",
@@ -146,6 +260,8 @@ class XlsxSearchViewer(tk.Tk):
         self.engines_path, self.config_path = ensure_default_files()
         self.cfg = load_config(self.config_path)
         self.engines = load_engines(self.engines_path)
+        self._cfg_dirty = False
+        self._cfg_after_id: Optional[str] = None
 
         self.title("AISearchViewerLite")
         self.geometry("1120x720")
@@ -160,13 +276,31 @@ class XlsxSearchViewer(tk.Tk):
         self.file_path: str = ""
         self.wb = None
         self.sheet_names: List[str] = []
+        self._sheet_cache: Dict[str, SheetData] = {}
+
+        # background parsing (Tk は別スレッドから触らない: 結果は after でポーリング)
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        self._load_token = 0
 
         # data model
         self.headers: List[str] = []
-        self.rows_all: List[List[str]] = []
-        self.rows_view: List[List[str]] = []
+        self.rows_all: List[Tuple[str, ...]] = []
+        self.rows_view: List[Tuple[str, ...]] = []
+        self._rows_all_lc: List[str] = []  # rows_all と同じ並び。フィルタ用
+        self._view_idx: List[int] = []     # rows_view の各行が rows_all の何番目か
+        self._last_q = ""                  # _view_idx を作ったフィルタ文字列
+        self._filter_after_id: Optional[str] = None
+        self._filter_gen = 0                # 新しいフィルタ/シートで増やし、古い途中処理を止める
+        self._filter_busy = False           # フィルタ結果を流し込み中
+
+        # virtual window: Treeview には rows_view[_top:] の見えている分だけ入れる
+        self._top = 0
+        self._iid_pos: Dict[str, int] = {}  # 表示中 iid -> rows_view の位置
+        self._row_h: Optional[int] = None   # 1行の高さ(px)。実測できるまで None
+        self._rows_y0 = 0                   # 見出しの高さ(px)
 
         # selection
+        self._sel_pos: Optional[int] = None  # 選択行の rows_view の位置（スクロールで消えても保持）
         self._rc_col_index: Optional[int] = None
 
         # sort state
@@ -176,11 +310,19 @@ class XlsxSearchViewer(tk.Tk):
         self._hl_enabled = os.name == "nt"
         self._hl_win: Optional[tk.Toplevel] = None
         self._hl_keycolor = "#ff00ff"  # transparent key color
+        self._hl_last_geom = ""  # 表示中の枠の geometry（同じなら Tk を呼ばない）
+        self._hl_after_id: Optional[str] = None
+
+        # 列幅計算用。measure は Tk 呼び出しなので同じ文字列は使い回す
+        self._font = tkfont.nametofont("TkDefaultFont")
+        self._measure = functools.lru_cache(maxsize=4096)(self._font.measure)
 
         self._build_ui()
         self._apply_config_to_ui()
         self._build_cell_highlight_window()
 
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
     # ---------------- UI ----------------
     def _build_ui(self) -> None:
         # Treeview selection の青を消して目立たなくする
@@ -206,7 +348,7 @@ class XlsxSearchViewer(tk.Tk):
         self.filter_var = tk.StringVar(value="")
         self.entry_filter = ttk.Entry(top, textvariable=self.filter_var, width=36)
         self.entry_filter.pack(side="left")
-        self.entry_filter.bind("<KeyRelease>", lambda e: self.apply_filter())
+        self.entry_filter.bind("<KeyRelease>", lambda e: self._schedule_filter())
         self.entry_filter.bind("<Return>", lambda e: self.search_default_engine())
 
         ttk.Button(top, text="クリア", command=self.clear_filter).pack(side="left", padx=(8, 0))
@@ -221,7 +363,8 @@ class XlsxSearchViewer(tk.Tk):
         self.hsb = ttk.Scrollbar(center, orient="horizontal", command=self._on_xscroll)
         self.vsb.grid(row=0, column=1, sticky="ns")
         self.hsb.grid(row=1, column=0, sticky="ew")
-        self.tree.configure(yscrollcommand=self.vsb.set, xscrollcommand=self.hsb.set)
+        # 縦スクロールは Treeview ではなく virtual window 側で管理する
+        self.tree.configure(xscrollcommand=self.hsb.set)
 
         center.grid_rowconfigure(0, weight=1)
         center.grid_columnconfigure(0, weight=1)
@@ -234,9 +377,21 @@ class XlsxSearchViewer(tk.Tk):
         self.tree.bind("<Button-3>", self.on_right_click)
         self.tree.bind("<<TreeviewSelect>>", lambda e: self._after_select())
         self.tree.bind("<Double-1>", lambda e: self.show_full_text())
-
-        # main window resize -> update highlight
-        self.bind("<Configure>", lambda e: self.draw_cell_highlight())
+        self.tree.bind("<Configure>", lambda e: self._refresh_visible())
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll_rows(-3))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_rows(3))
+        # 上の縦ホイールは Shift 付きにも当たるので、横スクロールを明示的に戻す
+        self.tree.bind("<Shift-MouseWheel>", self._on_shift_mousewheel)
+        self.tree.bind("<Shift-Button-4>", lambda e: self._scroll_cols(-3))
+        self.tree.bind("<Shift-Button-5>", lambda e: self._scroll_cols(3))
+        self.tree.bind("<Up>", lambda e: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda e: self._move_selection(-self._page_rows()))
+        self.tree.bind("<Next>", lambda e: self._move_selection(self._page_rows()))
+
+        # main window resize -> update highlight (ドラッグ中は連続で来るのでまとめる)
+        self.bind("<Configure>", lambda e: self._schedule_cell_highlight())
 
         bottom = ttk.Frame(self, padding=(10, 6, 10, 10))
         bottom.pack(fill="x")
@@ -255,6 +410,7 @@ class XlsxSearchViewer(tk.Tk):
         self.menu = tk.Menu(self, tearoff=0)
         self.menu_search = tk.Menu(self.menu, tearoff=0)
         self.menu.add_cascade(label="検索", menu=self.menu_search)
+        self._build_engine_menu()
         self.menu.add_separator()
         self.menu.add_command(label="全文表示", command=self.show_full_text)
         self.menu.add_command(label="コピー", command=self.copy_cell_text)
@@ -281,19 +437,53 @@ class XlsxSearchViewer(tk.Tk):
 
     # ---------------- Scroll hooks (枠のズレ防止) ----------------
     def _on_yscroll(self, *args) -> None:
-        self.tree.yview(*args)
-        self.draw_cell_highlight()
+        n = len(self.rows_view)
+        if not n or not args:
+            return
+        if args[0] == "moveto":
+            self._top = int(float(args[1]) * n)
+        elif args[0] == "scroll":
+            step = int(args[1])
+            self._top += step * self._page_rows() if args[2] == "pages" else step
+        self._refresh_visible()
+
+    def _on_mousewheel(self, event) -> str:
+        return self._scroll_rows(-3 if event.delta > 0 else 3)
+
+    def _scroll_rows(self, delta: int) -> str:
+        self._top += delta
+        self._refresh_visible()
+        return "break"
 
     def _on_xscroll(self, *args) -> None:
         self.tree.xview(*args)
         self.draw_cell_highlight()
 
+    def _on_shift_mousewheel(self, event) -> str:
+        return self._scroll_cols(-3 if event.delta > 0 else 3)
+
+    def _scroll_cols(self, delta: int) -> str:
+        self._on_xscroll("scroll", delta, "units")
+        return "break"
+
     # ---------------- Config ----------------
     def on_engine_changed(self) -> None:
         self.cfg["general"]["default_engine"] = self.engine_var.get()
-        save_config(self.cfg, self.config_path)
+        # 連続で切り替えても書き込みは最後の1回だけ（終了時にも書き出す）
+        self._cfg_dirty = True
+        if self._cfg_after_id is not None:
+            self.after_cancel(self._cfg_after_id)
+        self._cfg_after_id = self.after(1000, self._flush_cfg)
         self.update_status(extra="既定エンジンを保存")
 
+    def _flush_cfg(self) -> None:
+        if self._cfg_after_id is not None:
+            self.after_cancel(self._cfg_after_id)
+            self._cfg_after_id = None
+        if self._cfg_dirty:
+            save_config(self.cfg, self.config_path)
+            self._cfg_dirty = False
+
     def _alt_engine(self) -> str:
         alt = self.cfg.get("general", "alt_engine", fallback="Perplexity")
         if alt in self.engines:
@@ -309,13 +499,18 @@ class XlsxSearchViewer(tk.Tk):
         if not fp:
             return
         try:
-            self.wb = openpyxl.load_workbook(fp, read_only=True, data_only=False)
+            wb, sheet_names = open_workbook(
+                fp, fast_reader=self.cfg.getboolean("general", "fast_reader", fallback=False))
         except Exception as e:
             messagebox.showerror("読み込み失敗", f"{e}")
             return
 
+        if self.wb is not None:
+            close_workbook(self.wb)
+        self.wb = wb
+        self.sheet_names = sheet_names
+        self._sheet_cache.clear()
         self.file_path = fp
-        self.sheet_names = self.wb.sheetnames
         self.sheet_combo["values"] = self.sheet_names
         self.sheet_var.set(self.sheet_names[0] if self.sheet_names else "")
         self.load_sheet()
@@ -323,66 +518,156 @@ class XlsxSearchViewer(tk.Tk):
     def load_sheet(self) -> None:
         if not self.wb:
             return
-        ws = self.wb[self.sheet_var.get()]
-
-        max_row = ws.max_row or 0
-        max_col = ws.max_column or 0
-
-        values: List[List[str]] = []
-        for row in ws.iter_rows(min_row=1, max_row=max_row, max_col=max_col, values_only=False):
-            values.append([safe_str(cell.value) for cell in row])
-
-        # trim trailing empty columns
-        def col_empty(ci: int) -> bool:
-            for r in values:
-                if ci < len(r) and r[ci] != "":
-                    return False
-            return True
+        name = self.sheet_var.get()
+        cached = self._sheet_cache.get(name)
+        if cached is not None:
+            self._apply_sheet(cached)
+            return
 
-        last_col = max_col
-        while last_col > 0 and col_empty(last_col - 1):
-            last_col -= 1
-        values = [r[:last_col] for r in values]
+        self._load_token += 1
+        self.sheet_combo.configure(state="disabled")
+        self.status_var.set(f"{name} 読み込み中…")
+        fut = self._pool.submit(parse_sheet, self.wb, name)
+        self.after(30, self._poll_parse, fut, self._load_token, name)
 
-        col_letters = [openpyxl.utils.get_column_letter(i) for i in range(1, last_col + 1)]
-        self.headers = ["#"] + col_letters
+    def _poll_parse(self, fut: Future, token: int, name: str) -> None:
+        if not fut.done():
+            self.after(30, self._poll_parse, fut, token, name)
+            return
+        if token != self._load_token:
+            return  # 別ファイル/別シートの読み込みが始まっている
 
-        self.rows_all = [[str(i)] + r for i, r in enumerate(values, start=1)]
-        self.rows_view = self.rows_all[:]
+        self.sheet_combo.configure(state="readonly")
+        try:
+            parsed = fut.result()
+        except Exception as e:
+            messagebox.showerror("読み込み失敗", f"{e}")
+            self.update_status()
+            return
+        self._sheet_cache[name] = parsed
+        self._apply_sheet(parsed)
+
+    def _apply_sheet(self, parsed: SheetData) -> None:
+        self.headers, self.rows_all, self._rows_all_lc = parsed
+        self._filter_gen += 1
+        self._filter_busy = False
+        self._set_view(list(range(len(self.rows_all))))
+        self._last_q = ""
         self.filter_var.set("")
         self._sort_state.clear()
-        self._render_table()
+        self._rebuild_columns()
+        self._refresh_visible()
         self.update_status()
         self.hide_cell_highlight()
 
     # ---------------- Rendering ----------------
-    def _render_table(self) -> None:
-        self.tree.delete(*self.tree.get_children())
-
+    def _rebuild_columns(self) -> None:
+        """列構成の作り直し。シート読込時だけ（フィルタ/ソートでは呼ばない）"""
         self.tree["columns"] = list(range(len(self.headers)))
         for idx, h in enumerate(self.headers):
             self.tree.heading(idx, text=h, command=lambda c=idx: self.sort_by_column(c))
             w = 60 if idx == 0 else 140
             self.tree.column(idx, width=w, minwidth=50, stretch=True, anchor="w")
 
-        for i, row in enumerate(self.rows_view):
-            tag = "even" if i % 2 == 0 else "odd"
-            self.tree.insert("", "end", values=row, tags=(tag,))
-
         # 列幅自動調整（列ごと）
         self.autosize_columns(sample_rows=300)
 
+    def _row_metrics(self) -> Tuple[int, int]:
+        """(1行の高さ, 見出しの高さ)。表示済みの行から実測し、未計測なら控えめな推定値"""
+        if self._row_h is None:
+            kids = self.tree.get_children()
+            bbox = self.tree.bbox(kids[0]) if kids else ""
+            if not bbox:
+                return self._font.metrics("linespace"), 0
+            self._row_h, self._rows_y0 = bbox[3], bbox[1]
+        return self._row_h, self._rows_y0
+
+    def _page_rows(self) -> int:
+        """Treeview に収まる行数"""
+        row_h, y0 = self._row_metrics()
+        return max(1, (self.tree.winfo_height() - y0) // max(1, row_h))
+
+    def _refresh_visible(self) -> None:
+        """rows_view のうち _top から見えている分だけを Treeview に表示する。
+        行アイテムは作り直さず、表示行数ぶんを使い回して値だけ差し替える。
+        """
+        tree = self.tree
+        n = len(self.rows_view)
+        page = self._page_rows()
+        self._top = max(0, min(self._top, n - page))
+        top = self._top
+        end = min(n, top + page + 1)  # 下端の欠けた1行も入れる
+        want = end - top
+
+        # 行アイテムの数を表示行数に合わせる（増減するのはリサイズ時と末尾付近だけ）
+        kids = list(tree.get_children())
+        if len(kids) > want:
+            tree.delete(*kids[want:])
+            del kids[want:]
+        insert = tree.insert
+        for k in range(len(kids), want):
+            kids.append(insert("", "end", iid=f"r{k}"))
+
+        iid_pos: Dict[str, int] = {}
+        item = tree.item
+        rows_view = self.rows_view
+        for k, iid in enumerate(kids):
+            pos = top + k
+            item(iid, values=rows_view[pos], tags=_TAG_EVEN if (pos & 1) == 0 else _TAG_ODD)
+            iid_pos[iid] = pos
+        self._iid_pos = iid_pos
+        tree.yview_moveto(0)
+
+        # 選択は行アイテムではなく rows_view の位置に付いているので、表示位置に合わせ直す
+        sel_iid = self._pos_iid(self._sel_pos)
+        if sel_iid is None:
+            if tree.selection():
+                tree.selection_remove(*tree.selection())
+        elif tree.selection() != (sel_iid,):
+            tree.selection_set(sel_iid)
+
+        if n:
+            self.vsb.set(top / n, min(1.0, (top + page) / n))
+        else:
+            self.vsb.set(0.0, 1.0)
+
+        if self._row_h is None and n:
+            # 初回は行の高さが推定値なので、描画後に実測してやり直す
+            self.after_idle(self._remeasure_rows)
+        self.draw_cell_highlight()
+
+    def _pos_iid(self, pos: Optional[int]) -> Optional[str]:
+        """rows_view の位置 -> 表示中の iid（表示範囲外なら None）"""
+        if pos is None:
+            return None
+        k = pos - self._top
+        if 0 <= k < len(self._iid_pos):
+            return f"r{k}"
+        return None
+
+    def _remeasure_rows(self) -> None:
+        if self._row_h is None:
+            self._row_metrics()
+            if self._row_h is not None:
+                self._refresh_visible()
+
     def autosize_columns(self, sample_rows: int = 300, padding: int = 18, max_width: int = 520) -> None:
         if not self.headers:
             return
-        font = tkfont.nametofont("TkDefaultFont")
-        widths = [font.measure(h) + padding for h in self.headers]
-
-        for row in self.rows_view[:sample_rows]:
-            for i, val in enumerate(row):
-                w = font.measure(str(val)) + padding
-                if w > widths[i]:
-                    widths[i] = w
+        measure = self._measure
+        widths = [measure(h) + padding for h in self.headers]
+
+        sample = self.rows_view[:sample_rows]
+        for i in range(len(widths)):
+            cap = 80 if i == 0 else max_width
+            w_max = widths[i]
+            for row in sample:
+                if w_max >= cap:
+                    break  # どうせ上限で切るのでこれ以上測らない
+                w = measure(row[i]) + padding
+                if w > w_max:
+                    w_max = w
+            widths[i] = w_max
 
         for i, w in enumerate(widths):
             if i == 0:
@@ -393,31 +678,29 @@ class XlsxSearchViewer(tk.Tk):
 
     # ---------------- Sort ----------------
     def sort_by_column(self, col_index: int) -> None:
-        if not self.rows_view:
+        if not self.rows_view or self._filter_busy:
             return
 
         asc = self._sort_state.get(col_index, True)
         self._sort_state[col_index] = not asc
 
+        rows_all = self.rows_all
         if col_index == 0:
-            def key_func(r: List[str]) -> int:
-                try:
-                    return int(r[0])
-                except Exception:
-                    return 0
+            # "#" 列は rows_all の位置 + 1 なので位置そのものがキー
+            idx = sorted(self._view_idx, reverse=not asc)
         else:
-            def key_func(r: List[str]) -> str:
-                try:
-                    return (r[col_index] or "").lower()
-                except Exception:
-                    return ""
-
-        try:
-            self.rows_view.sort(key=key_func, reverse=not asc)
-        except Exception:
-            return
-
-        self._render_table()
+            # キーを先に1回だけ作り、比較は C 側（itemgetter）で済ませる
+            try:
+                decorated = [(rows_all[i][col_index].lower(), i) for i in self._view_idx]
+            except Exception:
+                return
+            decorated.sort(key=itemgetter(0), reverse=not asc)
+            idx = [d[1] for d in decorated]
+        self._set_view(idx)
+        # ソート後の _view_idx で絞り込むと並びがソート順のままになり、全件走査の結果と食い違う
+        self._last_q = ""
+
+        self._refresh_visible()
         self.update_status(extra=f"{self.headers[col_index]} で{'昇順' if asc else '降順'}ソート")
         self.draw_cell_highlight()
 
@@ -426,22 +709,78 @@ class XlsxSearchViewer(tk.Tk):
         self.filter_var.set("")
         self.apply_filter()
 
+    def _schedule_filter(self, delay_ms: int = 120) -> None:
+        # 連続入力中は再描画しない（最後のキー入力から delay_ms 後に1回だけ）
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(delay_ms, self.apply_filter)
+
     def apply_filter(self) -> None:
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+
+        self._filter_gen += 1
         q = self.filter_var.get().strip().lower()
         if not q:
-            self.rows_view = self.rows_all[:]
+            self._filter_busy = False
+            self._set_view(list(range(len(self.rows_all))))
+            self._last_q = q
+            self._refresh_visible()
+            self.update_status()
+            self.draw_cell_highlight()
+            return
+
+        if self._last_q and q.startswith(self._last_q):
+            # 入力を足しただけなら前回の結果の中だけを絞り込む
+            candidates: Sequence[int] = self._view_idx
         else:
-            self.rows_view = [r for r in self.rows_all if q in "\t".join(r).lower()]
-        self._render_table()
+            candidates = range(len(self.rows_all))
+        self._last_q = ""  # 走り終わるまで _view_idx は途中結果
+        self._filter_busy = True
+        self._set_view([])
+        self._filter_chunk(self._filter_gen, q, candidates, 0)
+
+    def _filter_chunk(self, gen: int, q: str, candidates: Sequence[int], start: int) -> None:
+        """candidates を _FILTER_CHUNK 行ずつ調べ、当たりを rows_view の末尾へ足していく。
+        大きいシートでも合間にイベントを処理できるよう、続きは after で回す。
+        """
+        if gen != self._filter_gen:
+            return  # 新しい入力/シートで置き換えられた
+
+        end = min(len(candidates), start + _FILTER_CHUNK)
+        lc = self._rows_all_lc
+        hits = [i for i in candidates[start:end] if q in lc[i]]
+        if hits:
+            rows_all = self.rows_all
+            self._view_idx.extend(hits)
+            self.rows_view.extend([rows_all[i] for i in hits])
+
+        if end < len(candidates):
+            self.after(1, self._filter_chunk, gen, q, candidates, end)
+            self._refresh_visible()
+            self.update_status(extra="フィルタ中…")
+            return
+
+        self._filter_busy = False
+        self._last_q = q
+        self._refresh_visible()
         self.update_status()
         self.draw_cell_highlight()
 
+    def _set_view(self, idx: List[int]) -> None:
+        self._view_idx = idx
+        rows_all = self.rows_all
+        self.rows_view = [rows_all[i] for i in idx]
+        self._top = 0
+        self._sel_pos = None
+
     # ---------------- Selection helpers ----------------
     def _get_selected_values(self) -> List[str]:
-        sel = self.tree.selection()
-        if not sel:
+        pos = self._sel_pos
+        if pos is None or not 0 <= pos < len(self.rows_view):
             return []
-        return list(self.tree.item(sel[0], "values") or [])
+        return list(self.rows_view[pos])
 
     def _get_selected_cell_text_raw(self) -> str:
         vals = self._get_selected_values()
@@ -456,9 +795,34 @@ class XlsxSearchViewer(tk.Tk):
         return normalize_query(self._get_selected_cell_text_raw())
 
     def _after_select(self) -> None:
+        # 選択行がスクロールで外れた(空選択)だけなら _sel_pos は保持する
+        sel = self.tree.selection()
+        if sel:
+            self._sel_pos = self._iid_pos.get(sel[0], self._sel_pos)
         self.update_status()
         self.draw_cell_highlight()
 
+    def _move_selection(self, delta: int) -> str:
+        """↑↓/PageUp/PageDown: 表示範囲外へも選択を動かし、必要ならスクロールする"""
+        n = len(self.rows_view)
+        if not n:
+            return "break"
+        pos = self._top if self._sel_pos is None else self._sel_pos + delta
+        pos = max(0, min(n - 1, pos))
+        self._sel_pos = pos
+
+        page = self._page_rows()
+        if pos < self._top:
+            self._top = pos
+        elif pos >= self._top + page:
+            self._top = pos - page + 1
+        self._refresh_visible()
+        iid = self._pos_iid(pos)
+        if iid is not None:
+            self.tree.focus(iid)
+        self.update_status()
+        return "break"
+
     # ---------------- Cell highlight (枠だけ) ----------------
     def _build_cell_highlight_window(self) -> None:
         if not self._hl_enabled:
@@ -491,7 +855,19 @@ class XlsxSearchViewer(tk.Tk):
         win.withdraw()
         self._hl_win = win
 
+    def _schedule_cell_highlight(self, delay_ms: int = 30) -> None:
+        if not self._hl_enabled:
+            return
+        if self._hl_after_id is not None:
+            self.after_cancel(self._hl_after_id)
+        self._hl_after_id = self.after(delay_ms, self._run_scheduled_highlight)
+
+    def _run_scheduled_highlight(self) -> None:
+        self._hl_after_id = None
+        self.draw_cell_highlight()
+
     def hide_cell_highlight(self) -> None:
+        self._hl_last_geom = ""
         if self._hl_win is not None:
             try:
                 self._hl_win.withdraw()
@@ -521,6 +897,9 @@ class XlsxSearchViewer(tk.Tk):
         # 枠が見やすいように少しだけ外へ
         pad = 0
         geom = f"{max(1, w + pad)}x{max(1, h + pad)}+{rx}+{ry}"
+        if geom == self._hl_last_geom:
+            return
+        self._hl_last_geom = geom
 
         try:
             self._hl_win.geometry(geom)
@@ -536,31 +915,35 @@ class XlsxSearchViewer(tk.Tk):
             return
 
         self.tree.selection_set(row_id)
+        self._sel_pos = self._iid_pos.get(row_id, self._sel_pos)
         try:
             self._rc_col_index = int(col_id[1:]) - 1
         except Exception:
             self._rc_col_index = 1
 
         self.draw_cell_highlight()
-        self._rebuild_engine_menu()
+        self._update_engine_menu_preview()
 
         try:
             self.menu.tk_popup(event.x_root, event.y_root)
         finally:
             self.menu.grab_release()
 
-    def _rebuild_engine_menu(self) -> None:
+    def _build_engine_menu(self) -> None:
+        """検索サブメニューを作る。エンジンは起動時に読むだけなので1回でよい"""
         self.menu_search.delete(0, "end")
 
-        preview = self._get_selected_cell_text()
-        if preview:
-            self.menu_search.add_command(label=f"検索語句: {truncate(preview, 60)}", state="disabled")
-            self.menu_search.add_separator()
+        # 0 番目は検索語句のプレビュー（右クリックのたびに label だけ差し替える）
+        self.menu_search.add_command(label="検索語句:", state="disabled")
+        self.menu_search.add_separator()
 
         for name in self.engines.keys():
             self.menu_search.add_command(label=f"{name}で検索", command=lambda n=name: self.search_with_engine(n))
 
-        self.engine_combo["values"] = list(self.engines.keys())
+    def _update_engine_menu_preview(self) -> None:
+        preview = self._get_selected_cell_text()
+        label = f"検索語句: {truncate(preview, 60)}" if preview else "検索語句: (空)"
+        self.menu_search.entryconfigure(0, label=label)
 
     # ---------------- Search ----------------
     def _make_search_url(self, engine_name: str, query: str) -> str:
@@ -662,6 +1045,16 @@ class XlsxSearchViewer(tk.Tk):
             msg += f"   | {extra}"
         self.status_var.set(msg)
 
+    # ---------------- Close ----------------
+    def on_close(self) -> None:
+        self._flush_cfg()
+        self._load_token += 1
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        if self.wb is not None:
+            close_workbook(self.wb)
+            self.wb = None
+        self.destroy()
+
 
 def main() -> None:
     app = XlsxSearchViewer()